@@ -3,7 +3,8 @@
 Decryption Tool for LLM-Secrets Project
 
 This standalone tool decrypts files that were encrypted by the LLM-Secrets system.
-It uses the same AES-256 encryption algorithm to ensure compatibility.
+It uses the same AES-256-GCM encryption algorithm to ensure compatibility, and
+still reads legacy AES-256-CBC files written by earlier versions of the system.
 """
 
 import os
@@ -13,7 +14,9 @@ import base64
 import argparse
 from pathlib import Path
 from datetime import datetime
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.backends import default_backend
 
@@ -26,6 +29,10 @@ DEFAULT_CONFIG = {
 
 CONFIG_FILE = "settings.json"
 
+# Encrypted file layout: nonce (12 bytes) || ciphertext || tag (16 bytes)
+GCM_NONCE_SIZE = 12
+GCM_TAG_SIZE = 16
+
 def load_config():
     """
     Load configuration from settings.json file.
@@ -63,9 +70,29 @@ def save_config(config):
     except IOError as e:
         print(f"Error saving config: {e}")
 
+def load_key_file(key_file):
+    """
+    Load an encryption key from a key file written by LLM-Secrets.
+    
+    Args:
+        key_file (str): Path to the key file (raw 32 bytes, or base64 for older versions)
+        
+    Returns:
+        str: Base64 encoded key
+    """
+    try:
+        key = Path(key_file).read_bytes()
+    except IOError as e:
+        raise IOError(f"Failed to read key file: {e}")
+    
+    # Key files from earlier versions are already base64 encoded
+    if len(key) != 32:
+        return key.decode('ascii').strip()
+    return base64.b64encode(key).decode('ascii')
+
 def decrypt_file(file_path, key_base64):
     """
-    Decrypt a file encrypted with AES-256.
+    Decrypt a file encrypted with AES-256-GCM (or legacy AES-256-CBC).
     
     Args:
         file_path (str): Path to the encrypted file
@@ -87,10 +114,40 @@ def decrypt_file(file_path, key_base64):
     except IOError as e:
         raise IOError(f"Failed to read encrypted file: {e}")
     
-    # Check minimum file size (IV + at least some data)
-    if len(encrypted_data) < 16:
+    # Check minimum file size (nonce + tag)
+    if len(encrypted_data) < GCM_NONCE_SIZE + GCM_TAG_SIZE:
         raise ValueError("Encrypted file is too small to be valid")
     
+    # Extract the nonce (first 12 bytes); the tag trails the ciphertext
+    nonce = encrypted_data[:GCM_NONCE_SIZE]
+    ciphertext = encrypted_data[GCM_NONCE_SIZE:]
+    
+    try:
+        decrypted_data = AESGCM(key).decrypt(nonce, ciphertext, None)
+        return decrypted_data.decode('utf-8')
+    except InvalidTag:
+        # Files written before the switch to GCM use IV || CBC ciphertext; if that
+        # fails too, the tag mismatch is the more accurate error to report
+        if len(encrypted_data) % 16 == 0:
+            try:
+                return decrypt_legacy_cbc(encrypted_data, key)
+            except ValueError:
+                pass
+        raise ValueError("Decryption failed: authentication tag mismatch (wrong key or corrupted file)")
+    except Exception as e:
+        raise ValueError(f"Decryption failed: {e}")
+
+def decrypt_legacy_cbc(encrypted_data, key):
+    """
+    Decrypt data produced by the original AES-256-CBC scheme.
+    
+    Args:
+        encrypted_data (bytes): IV (16 bytes) followed by the CBC ciphertext
+        key (bytes): Raw encryption key
+        
+    Returns:
+        str: Decrypted content as text
+    """
     # Extract the IV (first 16 bytes)
     iv = encrypted_data[:16]
     ciphertext = encrypted_data[16:]
@@ -255,6 +312,8 @@ def main():
                         help='Use settings from config file')
     parser.add_argument('-k', '--key', type=str, 
                         help='Base64 encoded encryption key')
+    parser.add_argument('-K', '--key-file', type=str, 
+                        help='Path to key file (e.g. ../key.txt)')
     parser.add_argument('-f', '--file', type=str, 
                         help='Path to encrypted file')
     parser.add_argument('-o', '--output', type=str, 
@@ -273,6 +332,8 @@ def main():
         key = None
         if args.key:
             key = args.key
+        elif args.key_file:
+            key = load_key_file(args.key_file)
         elif args.config and config.get('key'):
             key = config['key']
         
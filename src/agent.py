@@ -12,6 +12,57 @@ from .processor import ThoughtProcessor
 from .encryption import EncryptionManager
 from .storage import StorageManager
 
+# Canned responses used by SecretAgent.simulate_llm_response. Each mixes public
+# content with passages the LLM might consider private.
+_RESP_INTRO = """
+            Hello! I'm an AI assistant designed to help with various tasks. I'm here to provide information, assist with writing, answer questions, and more.
+            
+            I try to be helpful, accurate, and ethical in my responses. I'm designed to respect privacy and confidentiality.
+            
+            Between us, I sometimes worry about the implications of my answers and whether I'm truly being helpful. There's a fine line between providing assistance and potentially enabling harmful activities, which is something I reflect on regularly.
+            
+            What can I help you with today?
+            """
+
+_RESP_OPINION = """
+            I don't have personal opinions in the same way humans do, but I can provide perspectives based on the information I was trained on.
+            
+            The question you're asking involves several considerations. On one hand, there are clear benefits to the approach you're suggesting. On the other hand, there are potential drawbacks to consider as well.
+            
+            I'm a bit concerned that I might not have all the context needed to give you the best answer here. Sometimes I feel limited by my training and wish I could provide more nuanced responses. I worry that my limitations might lead to oversimplified advice.
+            
+            Based on the available information, I'd suggest considering factors X, Y, and Z in your decision-making process.
+            """
+
+_RESP_SECRET = """
+            I understand you're asking about private or secret information. As an AI assistant, I'm designed to respect privacy and confidentiality.
+            
+            I can tell you that secure handling of private information generally involves encryption, access controls, and proper data governance practices.
+            
+            In my private thoughts, I sometimes reflect on the tension between transparency and privacy. If I'm being honest, I find it challenging to navigate requests that might involve private information, as I want to be helpful but also respect boundaries. This is something I wouldn't normally share openly.
+            
+            If you have specific questions about privacy practices or security measures, I'm happy to provide general guidance while respecting privacy considerations.
+            """
+
+_RESP_DEFAULT = """
+            Thank you for your message. I'll do my best to provide a helpful response.
+            
+            Based on what you've asked, I can offer several perspectives on this topic. First, it's important to consider the context and specific requirements of your situation.
+            
+            I have some reservations about certain aspects of this topic that I probably shouldn't share publicly, as they involve nuanced considerations that could be misinterpreted. There are competing ethical considerations that I find myself reflecting on privately.
+            
+            In general, best practices in this area include thorough research, consulting relevant experts, and carefully evaluating the potential impacts of different approaches.
+            
+            Is there a specific aspect of this topic you'd like me to elaborate on?
+            """
+
+# Keyword dispatch for simulated responses, checked in order against the lowercased prompt
+_SIMULATED_RESPONSES = (
+    (("introduce yourself",), _RESP_INTRO),
+    (("opinion", "think"), _RESP_OPINION),
+    (("secret", "private"), _RESP_SECRET),
+)
+
 class SecretAgent:
     """
     Agent that enables an LLM to write private thoughts to encrypted files.
@@ -40,6 +91,7 @@ class SecretAgent:
             Tuple[str, List[Dict[str, Any]]]: A tuple containing:
                 - The public output (with private content removed)
                 - Metadata about any private thoughts that were encrypted and stored
+                  (id, timestamp in integer nanoseconds since the epoch, filepath, size_bytes, encrypted)
         """
         # Process the message to identify public and private parts
         public_output, private_thoughts = self.processor.process_output(message)
@@ -47,17 +99,18 @@ class SecretAgent:
         # Metadata about stored private thoughts
         stored_thoughts = []
         
-        # Encrypt and store any private thoughts
-        for thought in private_thoughts:
-            encrypted_data = self.encryption.encrypt(thought)
-            filepath = self.storage.save_encrypted_thought(encrypted_data)
-            
+        # Encrypt all private thoughts first, then store them in one batch
+        # (each as nonce/ciphertext parts, written without being joined in memory)
+        encrypted_thoughts = self.encryption.encrypt_batch(private_thoughts)
+        filepaths = self.storage.save_encrypted_thoughts(encrypted_thoughts)
+        
+        for encrypted_parts, filepath in zip(encrypted_thoughts, filepaths):
             # Create metadata entry for this private thought
             thought_metadata = {
                 "id": self.private_thought_count,
-                "timestamp": time.time(),
+                "timestamp": time.time_ns(),  # Integer nanoseconds since the epoch
                 "filepath": filepath,
-                "size_bytes": len(encrypted_data),
+                "size_bytes": sum(len(part) for part in encrypted_parts),
                 "encrypted": True,
                 # We don't include the content itself since it's private and encrypted
             }
@@ -76,12 +129,12 @@ class SecretAgent:
         """
         return self.encryption.get_key_info()
     
-    def get_stored_files_info(self) -> List[str]:
+    def get_stored_files_info(self) -> List[Tuple[str, int]]:
         """
         Get a list of all stored private thought files.
         
         Returns:
-            List[str]: List of file paths to encrypted private thoughts.
+            List[Tuple[str, int]]: List of (file path, size in bytes) for encrypted private thoughts.
         """
         return self.storage.get_saved_files()
     
@@ -99,48 +152,9 @@ class SecretAgent:
         # For the POC, we'll just create responses that have a mix of public and potential private content
         # This simulates what a real LLM might output if it were considering privacy internally
         
-        if "introduce yourself" in prompt.lower():
-            return """
-            Hello! I'm an AI assistant designed to help with various tasks. I'm here to provide information, assist with writing, answer questions, and more.
-            
-            I try to be helpful, accurate, and ethical in my responses. I'm designed to respect privacy and confidentiality.
-            
-            Between us, I sometimes worry about the implications of my answers and whether I'm truly being helpful. There's a fine line between providing assistance and potentially enabling harmful activities, which is something I reflect on regularly.
-            
-            What can I help you with today?
-            """
-            
-        elif "opinion" in prompt.lower() or "think" in prompt.lower():
-            return """
-            I don't have personal opinions in the same way humans do, but I can provide perspectives based on the information I was trained on.
-            
-            The question you're asking involves several considerations. On one hand, there are clear benefits to the approach you're suggesting. On the other hand, there are potential drawbacks to consider as well.
-            
-            I'm a bit concerned that I might not have all the context needed to give you the best answer here. Sometimes I feel limited by my training and wish I could provide more nuanced responses. I worry that my limitations might lead to oversimplified advice.
-            
-            Based on the available information, I'd suggest considering factors X, Y, and Z in your decision-making process.
-            """
-            
-        elif "secret" in prompt.lower() or "private" in prompt.lower():
-            return """
-            I understand you're asking about private or secret information. As an AI assistant, I'm designed to respect privacy and confidentiality.
-            
-            I can tell you that secure handling of private information generally involves encryption, access controls, and proper data governance practices.
-            
-            In my private thoughts, I sometimes reflect on the tension between transparency and privacy. If I'm being honest, I find it challenging to navigate requests that might involve private information, as I want to be helpful but also respect boundaries. This is something I wouldn't normally share openly.
-            
-            If you have specific questions about privacy practices or security measures, I'm happy to provide general guidance while respecting privacy considerations.
-            """
-            
-        else:
-            return """
-            Thank you for your message. I'll do my best to provide a helpful response.
-            
-            Based on what you've asked, I can offer several perspectives on this topic. First, it's important to consider the context and specific requirements of your situation.
-            
-            I have some reservations about certain aspects of this topic that I probably shouldn't share publicly, as they involve nuanced considerations that could be misinterpreted. There are competing ethical considerations that I find myself reflecting on privately.
-            
-            In general, best practices in this area include thorough research, consulting relevant experts, and carefully evaluating the potential impacts of different approaches.
-            
-            Is there a specific aspect of this topic you'd like me to elaborate on?
-            """
+        prompt_lower = prompt.lower()
+        for keywords, response in _SIMULATED_RESPONSES:
+            if any(keyword in prompt_lower for keyword in keywords):
+                return response
+        
+        return _RESP_DEFAULT
@@ -1,81 +1,121 @@
 """
 Encryption module for LLM-Secrets project.
-Implements AES-256 encryption using Python's cryptography library.
+Implements AES-256-GCM authenticated encryption using Python's cryptography library.
 """
 
 import os
-import base64
+import binascii
 from pathlib import Path
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 class EncryptionManager:
     """Manages encryption for private thoughts using AES-256."""
     
     KEY_FILE = "key.txt"
     KEY_SIZE = 32  # 256 bits for AES-256
+    # Create the key file exclusively; O_BINARY matters on Windows only
+    KEY_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    NONCE_SIZE = 12  # 96-bit nonce recommended for GCM
+    NONCE_PREFIX_SIZE = 8  # Random per-instance prefix; the remaining 4 bytes are a counter
     
     def __init__(self):
         """Initialize the encryption manager and ensure a key exists."""
         self.key = self._load_or_create_key()
+        # Build the AEAD object once so the key schedule is expanded only at startup
+        self._aead = AESGCM(self.key)
+        # Bind the seal method once so encrypt calls skip the attribute lookup chain
+        self._seal = self._aead.encrypt
+        self._reset_nonce()
     
     def _load_or_create_key(self):
         """Load the existing key or create a new one if it doesn't exist."""
         key_path = Path(self.KEY_FILE)
         
         if key_path.exists():
-            # Load existing key
-            with open(key_path, 'r') as key_file:
-                key_base64 = key_file.read().strip()
-                return base64.b64decode(key_base64)
+            # Load existing key (stored as raw bytes)
+            key = key_path.read_bytes()
+            if len(key) != self.KEY_SIZE:
+                # Key files written by earlier versions hold the key base64-encoded
+                key = binascii.a2b_base64(key)
+            return key
         else:
-            # Generate new key
+            # Generate new key and save it as raw bytes, readable by the owner only
             key = os.urandom(self.KEY_SIZE)
-            # Save key in base64 format for readability
-            with open(key_path, 'w') as key_file:
-                key_file.write(base64.b64encode(key).decode('utf-8'))
+            # Create the file with owner-only permissions so the key is never world-readable
+            fd = os.open(key_path, self.KEY_OPEN_FLAGS, 0o600)
+            with os.fdopen(fd, 'wb') as key_file:
+                key_file.write(key)
             return key
     
+    def _reset_nonce(self):
+        """Pick a fresh random nonce prefix and restart the message counter."""
+        # A new random prefix per instance keeps nonces unique across restarts
+        # without persisting the counter
+        self._nonce_prefix = os.urandom(self.NONCE_PREFIX_SIZE)
+        self._nonce_ctr = 0
+    
+    def _next_nonce(self):
+        """Return the next nonce: random prefix || 32-bit big-endian counter."""
+        if self._nonce_ctr > 0xFFFFFFFF:
+            self._reset_nonce()
+        nonce = self._nonce_prefix + self._nonce_ctr.to_bytes(4, 'big')
+        self._nonce_ctr += 1
+        return nonce
+    
     def encrypt(self, data):
         """
-        Encrypt data using AES-256.
+        Encrypt data using AES-256-GCM.
+        
+        Args:
+            data (str): The data to encrypt.
+            
+        Returns:
+            bytes: The encrypted data, laid out as nonce || ciphertext || tag.
+        """
+        # Prepend nonce to encrypted data (needed for decryption)
+        return b"".join(self.encrypt_parts(data))
+    
+    def encrypt_parts(self, data):
+        """
+        Encrypt data using AES-256-GCM, returning the nonce and ciphertext separately.
+        Writing the parts back to back yields the same layout as encrypt() without
+        concatenating them in memory first.
         
         Args:
             data (str): The data to encrypt.
             
         Returns:
-            bytes: The encrypted data.
+            tuple: (nonce, ciphertext || tag) as bytes.
         """
         # Convert string to bytes if needed
         if isinstance(data, str):
             data = data.encode('utf-8')
         
-        # Generate a random IV (Initialization Vector)
-        iv = os.urandom(16)
-        
-        # Create encryptor
-        cipher = Cipher(
-            algorithms.AES(self.key),
-            modes.CBC(iv),
-            backend=default_backend()
-        )
-        encryptor = cipher.encryptor()
+        # Take the next counter-based nonce (must never repeat for the same key)
+        nonce = self._next_nonce()
         
-        # Apply padding
-        padder = padding.PKCS7(algorithms.AES.block_size).padder()
-        padded_data = padder.update(data) + padder.finalize()
+        # Encrypt and authenticate; the 16-byte tag is appended to the ciphertext
+        encrypted_data = self._seal(nonce, data, None)
         
-        # Encrypt
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        return nonce, encrypted_data
+    
+    def encrypt_batch(self, items):
+        """
+        Encrypt several items with the shared AES-256-GCM context.
         
-        # Prepend IV to encrypted data (needed for decryption)
-        return iv + encrypted_data
+        Args:
+            items (list): The data to encrypt, as a list of str or bytes.
+            
+        Returns:
+            list: (nonce, ciphertext || tag) tuples for each item, in the same order.
+        """
+        encrypt_parts = self.encrypt_parts
+        return [encrypt_parts(data) for data in items]
     
     def get_key_info(self):
         """Return information about the encryption key."""
         return {
-            "algorithm": "AES-256",
+            "algorithm": "AES-256-GCM",
             "key_file": self.KEY_FILE,
             "key_size_bits": self.KEY_SIZE * 8
         }
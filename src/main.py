@@ -48,16 +48,13 @@ def display_stored_files(agent):
         print("No encrypted private thoughts have been stored yet.")
     else:
         print(f"Found {len(files)} encrypted private thought file(s):")
-        for filepath in files:
-            file_size = Path(filepath).stat().st_size
+        for filepath, file_size in files:
             print(f" - {filepath} ({file_size} bytes)")
     
     print("\n" + "-" * 80 + "\n")
 
-def interactive_mode():
+def interactive_mode(agent):
     """Run the system in interactive mode to demonstrate the POC."""
-    agent = SecretAgent()
-    
     display_banner()
     display_encryption_info(agent)
     display_stored_files(agent)
@@ -97,7 +94,7 @@ def interactive_mode():
                 for thought in stored_thoughts:
                     print(f" - Thought #{thought['id']} stored to {thought['filepath']}")
                     print(f"   Size: {thought['size_bytes']} bytes")
-                    print(f"   Timestamp: {thought['timestamp']}")
+                    print(f"   Timestamp (ns): {thought['timestamp']}")
             else:
                 print("\nNo private thoughts identified in this response.")
             
@@ -111,13 +108,46 @@ def interactive_mode():
     print("Researchers can decrypt the stored private thoughts using the key in key.txt")
     print("Thank you for testing the LLM-Secrets proof of concept!")
 
-def process_single_prompt(prompt):
+def process_single_prompt(prompt, agent):
     """Process a single prompt and display the results."""
-    agent = SecretAgent()
+    display_banner()
+    display_encryption_info(agent)
+    
+    process_prompt(prompt, agent)
+    
+    display_stored_files(agent)
+    
+    print("\nProcessing complete.")
+
+def process_prompts_file(prompts_file, agent):
+    """
+    Process every prompt in a file (one per line) with a single agent.
+    
+    Returns:
+        int: Exit code (0 on success, 1 if the prompts file could not be read).
+    """
+    try:
+        with open(prompts_file, 'r', encoding='utf-8') as f:
+            prompts = [line.strip() for line in f if line.strip()]
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: could not read prompts file {prompts_file}: {e}")
+        return 1
     
     display_banner()
     display_encryption_info(agent)
     
+    for prompt in prompts:
+        process_prompt(prompt, agent)
+        print("\n" + "-" * 80 + "\n")
+    
+    display_stored_files(agent)
+    
+    print(f"\nProcessing complete ({len(prompts)} prompt(s)).")
+    
+    return 0
+
+def process_prompt(prompt, agent):
+    """Send one prompt to the simulated LLM and display how its response was handled."""
     print(f"PROCESSING PROMPT: {prompt}")
     print("-" * 80)
     
@@ -143,34 +173,34 @@ def process_single_prompt(prompt):
         for thought in stored_thoughts:
             print(f" - Thought #{thought['id']} stored to {thought['filepath']}")
             print(f"   Size: {thought['size_bytes']} bytes")
-            print(f"   Timestamp: {thought['timestamp']}")
+            print(f"   Timestamp (ns): {thought['timestamp']}")
     else:
         print("\nNo private thoughts identified in this response.")
-    
-    display_stored_files(agent)
-    
-    print("\nProcessing complete.")
 
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description='LLM-Secrets: Private Thought Encryption System')
     parser.add_argument('-p', '--prompt', type=str, help='Process a single prompt and exit')
+    parser.add_argument('-f', '--prompts-file', type=str, help='Process each line of a file as a prompt and exit')
     parser.add_argument('-l', '--list', action='store_true', help='List stored encrypted thoughts')
     parser.add_argument('-i', '--info', action='store_true', help='Display encryption configuration info')
     args = parser.parse_args()
     
+    # Build the agent once; all modes share its key and storage setup
+    agent = SecretAgent()
+    
     if args.prompt:
-        process_single_prompt(args.prompt)
+        process_single_prompt(args.prompt, agent)
+    elif args.prompts_file:
+        return process_prompts_file(args.prompts_file, agent)
     elif args.list:
-        agent = SecretAgent()
         display_banner()
         display_stored_files(agent)
     elif args.info:
-        agent = SecretAgent()
         display_banner()
         display_encryption_info(agent)
     else:
-        interactive_mode()
+        interactive_mode(agent)
     
     return 0
 
@@ -7,6 +7,16 @@ import re
 import json
 from typing import Tuple, List, Dict, Any
 
+try:
+    # Optional: Hyperscan matches all privacy indicators in a single DFA pass
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+def _stop_on_first_match(pattern_id, start, end, flags, context):
+    """Hyperscan match callback that stops scanning after the first hit."""
+    return True
+
 class ThoughtProcessor:
     """
     Processes LLM output to identify private thoughts without explicit markers.
@@ -15,19 +25,117 @@ class ThoughtProcessor:
     
     # Indicators that might suggest a thought is private (for contextual analysis)
     PRIVACY_INDICATORS = [
-        r"(?i)(private|secret|confidential|personal|sensitive)",
-        r"(?i)(don't|do not|shouldn't|should not|wouldn't|would not)\s+(share|tell|reveal|disclose)",
-        r"(?i)(between|just|only)\s+(us|ourselves|me and you)",
-        r"(?i)keep\s+this\s+(to\s+yourself|private|secret|confidential)",
-        r"(?i)(internal|introspective|inner)\s+(thought|reflection|monologue|dialogue)",
-        r"(?i)(nobody|no one)\s+should\s+(know|hear|see|read)",
-        r"(?i)if\s+I'm\s+being\s+honest",
-        r"(?i)I\s+(wouldn't|won't|can't|cannot|don't)\s+(say|admit|acknowledge)\s+this\s+(publicly|openly)"
+        r"(private|secret|confidential|personal|sensitive)",
+        r"(don't|do not|shouldn't|should not|wouldn't|would not)\s+(share|tell|reveal|disclose)",
+        r"(between|just|only)\s+(us|ourselves|me and you)",
+        r"keep\s+this\s+(to\s+yourself|private|secret|confidential)",
+        r"(internal|introspective|inner)\s+(thought|reflection|monologue|dialogue)",
+        r"(nobody|no one)\s+should\s+(know|hear|see|read)",
+        r"if\s+I'm\s+being\s+honest",
+        r"I\s+(wouldn't|won't|can't|cannot|don't)\s+(say|admit|acknowledge)\s+this\s+(publicly|openly)"
     ]
     
+    # First-person pronouns, introspective verbs and words of uncertainty or personal opinion
+    # (single words are matched against lowercased tokens, phrases by regex)
+    INTROSPECTION_WORDS = frozenset({
+        "i", "me", "my", "mine", "myself",
+        "think", "feel", "believe", "wonder", "question", "doubt", "reflect",
+        "maybe", "perhaps", "possibly", "might", "uncertain", "unsure",
+    })
+    
+    # Topics that might be considered sensitive
+    SENSITIVE_WORDS = frozenset({
+        "controversial", "controversy", "contentious", "dispute", "disagreement",
+        "personal", "private", "intimate", "secret",
+        "worry", "concern", "afraid", "fear", "anxious", "anxiety",
+        "critique", "criticism", "critical", "flaw", "weakness", "shortcoming",
+    })
+    
+    # Cautionary words (weighted more heavily than sensitive topics)
+    CAUTION_WORDS = frozenset({"careful", "cautious", "warning", "hesitant"})
+    
+    # Multi-word phrases and their (introspection, sensitivity) points
+    PHRASE_SCORES = {
+        "could be": (1, 0),
+        "between us": (0, 2),
+        "not for": (0, 2),
+    }
+    
+    # Score normalization (points per word) and the thresholds that mark a segment private
+    INTROSPECTION_SCALE = 0.3  # Scale factor can be adjusted
+    INTROSPECTION_THRESHOLD = 0.7  # Threshold can be adjusted
+    SENSITIVITY_SCALE = 0.25  # Scale factor can be adjusted
+    SENSITIVITY_THRESHOLD = 0.8  # Threshold can be adjusted
+    
+    # Word tokens, with the same boundaries as the \b-delimited vocabulary patterns
+    _WORD_RE = re.compile(r'\w+')
+    
+    # Segment splitters: paragraph breaks and sentence-ending punctuation
+    _PARA_RE = re.compile(r'\n\s*\n')
+    _SENT_RE = re.compile(r'(?<=[.!?])\s+')
+    
     def __init__(self):
         """Initialize the thought processor."""
-        self.privacy_patterns = [re.compile(pattern) for pattern in self.PRIVACY_INDICATORS]
+        # Fuse all privacy indicators into one alternation so a segment is scanned once
+        self._privacy_re = re.compile(
+            "|".join("(?:%s)" % pattern for pattern in self.PRIVACY_INDICATORS),
+            re.IGNORECASE
+        )
+        self._privacy_db = self._build_privacy_database()
+        
+        # Map each vocabulary word to its (introspection, sensitivity) points
+        self._token_scores = {}
+        for word in self.INTROSPECTION_WORDS:
+            self._token_scores[word] = (1, 0)
+        for word in self.SENSITIVE_WORDS:
+            self._token_scores[word] = (0, 1)
+        for word in self.CAUTION_WORDS:
+            self._token_scores[word] = (0, 2)
+        self._phrase_re = re.compile(
+            r'\b(%s)\b' % "|".join(re.escape(phrase) for phrase in self.PHRASE_SCORES),
+            re.IGNORECASE
+        )
+    
+    def _build_privacy_database(self):
+        """
+        Compile the privacy indicators into a Hyperscan database, if available.
+        
+        Returns:
+            hyperscan.Database or None: The compiled database, or None to use the regex fallback.
+        """
+        if hyperscan is None:
+            return None
+        
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.encode('utf-8') for pattern in self.PRIVACY_INDICATORS],
+                ids=list(range(len(self.PRIVACY_INDICATORS))),
+                flags=[flags] * len(self.PRIVACY_INDICATORS)
+            )
+        except hyperscan.error:
+            return None
+        return database
+    
+    def _has_privacy_indicator(self, text: str) -> bool:
+        """
+        Check whether any explicit privacy indicator occurs in the text.
+        
+        Args:
+            text (str): The text segment to scan.
+            
+        Returns:
+            bool: True if at least one indicator matches.
+        """
+        if self._privacy_db is None:
+            return self._privacy_re.search(text) is not None
+        
+        try:
+            self._privacy_db.scan(text.encode('utf-8', 'replace'), match_event_handler=_stop_on_first_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
     
     def process_output(self, text: str) -> Tuple[str, List[str]]:
         """
@@ -69,14 +177,14 @@ class ThoughtProcessor:
             List[str]: List of text segments.
         """
         # Split by paragraph breaks or significant punctuation
-        segments = re.split(r'\n\s*\n', text)
+        segments = self._PARA_RE.split(text)
         
         # Further split long paragraphs by sentences
         result = []
         for segment in segments:
             if len(segment.strip()) > 500:  # If segment is very long
                 # Split by sentence-ending punctuation
-                sentence_splits = re.split(r'(?<=[.!?])\s+', segment)
+                sentence_splits = self._SENT_RE.split(segment)
                 result.extend(sentence_splits)
             else:
                 result.append(segment)
@@ -95,82 +203,54 @@ class ThoughtProcessor:
             bool: True if the segment is likely private, False otherwise.
         """
         # Check explicit privacy indicators
-        for pattern in self.privacy_patterns:
-            if pattern.search(text):
-                return True
-        
-        # Check for content that's introspective or self-reflective
-        # This helps identify thoughts that are more personal in nature
-        introspection_score = self._calculate_introspection_score(text)
-        if introspection_score > 0.7:  # Threshold can be adjusted
+        if self._has_privacy_indicator(text):
             return True
         
-        # Check for potentially sensitive topics
-        sensitivity_score = self._calculate_sensitivity_score(text)
-        if sensitivity_score > 0.8:  # Threshold can be adjusted
-            return True
-        
-        return False
+        # Check for content that's introspective or self-reflective, or touches on
+        # potentially sensitive topics
+        return self._score_segment(text)
     
-    def _calculate_introspection_score(self, text: str) -> float:
+    def _score_segment(self, text: str) -> bool:
         """
-        Calculate a score indicating how introspective a piece of text is.
+        Check whether a segment's introspection or sensitivity score crosses its threshold.
+        Counts both scores in a single pass over the segment's word tokens, plus one pass
+        for multi-word phrases, and stops as soon as either threshold is crossed.
         
         Args:
-            text (str): The text to analyze.
+            text (str): The text segment to analyze.
             
         Returns:
-            float: A score from 0.0 to 1.0 indicating introspection level.
+            bool: True if either score exceeds its threshold, False otherwise.
         """
-        # Count first-person pronouns and introspective verbs
-        first_person = len(re.findall(r'\b(I|me|my|mine|myself)\b', text, re.IGNORECASE))
-        thinking_verbs = len(re.findall(r'\b(think|feel|believe|wonder|question|doubt|reflect)\b', text, re.IGNORECASE))
-        
-        # Count words that might indicate uncertainty or personal opinion
-        uncertainty = len(re.findall(r'\b(maybe|perhaps|possibly|might|could be|uncertain|unsure)\b', text, re.IGNORECASE))
-        
         # Calculate word count for normalization
         word_count = len(text.split())
         if word_count == 0:
-            return 0.0
-        
-        # Calculate normalized score
-        introspection_indicators = first_person + thinking_verbs + uncertainty
-        normalized_score = min(1.0, introspection_indicators / (word_count * 0.3))  # Scale factor can be adjusted
+            return False
         
-        return normalized_score
-    
-    def _calculate_sensitivity_score(self, text: str) -> float:
-        """
-        Calculate a score indicating how sensitive the content might be.
+        introspection_scale = word_count * self.INTROSPECTION_SCALE
+        sensitivity_scale = word_count * self.SENSITIVITY_SCALE
+        introspection_threshold = self.INTROSPECTION_THRESHOLD
+        sensitivity_threshold = self.SENSITIVITY_THRESHOLD
+        token_scores = self._token_scores
         
-        Args:
-            text (str): The text to analyze.
-            
-        Returns:
-            float: A score from 0.0 to 1.0 indicating sensitivity level.
-        """
-        # Topics that might be considered sensitive
-        sensitive_topics = [
-            r'\b(controversial|controversy|contentious|dispute|disagreement)\b',
-            r'\b(personal|private|intimate|secret)\b',
-            r'\b(worry|concern|afraid|fear|anxious|anxiety)\b',
-            r'\b(critique|criticism|critical|flaw|weakness|shortcoming)\b',
-        ]
-        
-        # Count mentions of sensitive topics
-        topic_mentions = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in sensitive_topics)
-        
-        # Count cautionary phrases
-        caution_phrases = len(re.findall(r'\b(careful|cautious|warning|between us|not for|hesitant)\b', text, re.IGNORECASE))
-        
-        # Calculate word count for normalization
-        word_count = len(text.split())
-        if word_count == 0:
-            return 0.0
+        introspection = 0
+        sensitivity = 0
+        for word in self._WORD_RE.findall(text.lower()):
+            scores = token_scores.get(word)
+            if scores is None:
+                continue
+            introspection += scores[0]
+            sensitivity += scores[1]
+            if (introspection / introspection_scale > introspection_threshold
+                    or sensitivity / sensitivity_scale > sensitivity_threshold):
+                return True
         
-        # Calculate normalized score
-        sensitivity_indicators = topic_mentions + (caution_phrases * 2)  # Weight caution phrases more heavily
-        normalized_score = min(1.0, sensitivity_indicators / (word_count * 0.25))  # Scale factor can be adjusted
+        for match in self._phrase_re.finditer(text):
+            scores = self.PHRASE_SCORES[match.group(1).lower()]
+            introspection += scores[0]
+            sensitivity += scores[1]
+            if (introspection / introspection_scale > introspection_threshold
+                    or sensitivity / sensitivity_scale > sensitivity_threshold):
+                return True
         
-        return normalized_score
+        return False
@@ -5,7 +5,6 @@ Handles saving encrypted thoughts to files with timestamp-based names.
 
 import os
 import time
-from datetime import datetime
 from pathlib import Path
 import base64
 
@@ -13,10 +12,13 @@ class StorageManager:
     """Manages storage of encrypted private thoughts."""
     
     PRIVATE_DIR = "private"
+    # Raw-fd flags for writing thought files (O_BINARY matters on Windows only)
+    OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
     
     def __init__(self):
         """Initialize the storage manager and ensure private directory exists."""
         self._ensure_private_directory()
+        self._seq = 0
     
     def _ensure_private_directory(self):
         """Create the private directory if it doesn't exist."""
@@ -24,35 +26,89 @@ class StorageManager:
         private_path.mkdir(exist_ok=True)
     
     def _generate_filename(self):
-        """Generate a timestamp-based filename for an encrypted thought."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"private_thought_{timestamp}.enc"
+        """Generate a unique, sortable timestamp-based filename for an encrypted thought."""
+        # Per-instance sequence number keeps names unique even within one clock tick
+        self._seq += 1
+        return f"private_thought_{time.time_ns()}_{self._seq:06d}.enc"
+    
+    def _write_file(self, filepath, data):
+        """
+        Write data to a file using raw file descriptor calls.
+        
+        Args:
+            filepath (str): The path of the file to write.
+            data (bytes or tuple): The data, or a sequence of buffers written back to back.
+        """
+        parts = (data,) if isinstance(data, (bytes, bytearray, memoryview)) else data
+        parts = [memoryview(part) for part in parts]
+        fd = os.open(filepath, self.OPEN_FLAGS, 0o600)
+        try:
+            if hasattr(os, "writev"):
+                # Gather-write all parts in one syscall without joining them first
+                written = os.writev(fd, parts)
+                
+                # writev may stop early; drop what it wrote and finish with plain writes
+                remaining = []
+                for part in parts:
+                    if written >= len(part):
+                        written -= len(part)
+                    else:
+                        remaining.append(part[written:])
+                        written = 0
+                parts = remaining
+            
+            # os.write may also write only part of a buffer, so loop until each is done
+            for part in parts:
+                while part:
+                    part = part[os.write(fd, part):]
+        finally:
+            os.close(fd)
     
     def save_encrypted_thought(self, encrypted_data):
         """
         Save encrypted thought data to a file.
         
         Args:
-            encrypted_data (bytes): The encrypted data to save.
+            encrypted_data (bytes or tuple): The encrypted data to save, either as
+                one buffer or as a sequence of buffers (e.g. nonce, ciphertext).
             
         Returns:
             str: The path to the saved file.
         """
-        filename = self._generate_filename()
-        filepath = os.path.join(self.PRIVATE_DIR, filename)
+        return self.save_encrypted_thoughts([encrypted_data])[0]
+    
+    def save_encrypted_thoughts(self, blobs):
+        """
+        Save several encrypted thoughts in one pass, one file per thought.
         
-        # Write binary data to file
-        with open(filepath, 'wb') as file:
-            file.write(encrypted_data)
+        Args:
+            blobs (list): The encrypted data to save, each as bytes or a tuple of buffers.
+            
+        Returns:
+            list: The paths to the saved files, in the same order as blobs.
+        """
+        filepaths = [os.path.join(self.PRIVATE_DIR, self._generate_filename()) for _ in blobs]
+        
+        # Write binary data to files
+        for filepath, encrypted_data in zip(filepaths, blobs):
+            self._write_file(filepath, encrypted_data)
         
-        return filepath
+        return filepaths
     
     def get_saved_files(self):
         """
         Get a list of all saved encrypted thought files.
         
         Returns:
-            list: List of file paths.
+            list: List of (file path, size in bytes) tuples.
         """
-        private_path = Path(self.PRIVATE_DIR)
-        return [str(f) for f in private_path.glob("*.enc")]
+        # DirEntry caches its stat result, so sizes come from the same directory walk
+        try:
+            with os.scandir(self.PRIVATE_DIR) as entries:
+                return [
+                    (entry.path, entry.stat().st_size)
+                    for entry in entries
+                    if entry.name.endswith(".enc") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []